@@ -1,12 +1,9 @@
-import re
 from datetime import date
-from typing import Iterable, Optional, Pattern
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
 import functools
 
-from . import exc, conv
-from .value_objs import ColumnType, PythonType
-
-WHITESPACE_REGEX = re.compile(r"^ *$")
+from . import exc
+from .value_objs import Column, ColumnType, PythonType
 
 
 NULL_STRINGS = {
@@ -27,23 +24,99 @@ NULL_STRINGS = {
 }
 
 
-def sniff_and_allow_blanks(regex: Pattern, values: Iterable[str]) -> bool:
-    """This function takes a regex and looks at the values, return if:
-    - at least one value matches the regex
-    - the others are blanks
+# Sniffing is done without regexes.  Character class checks use
+# bytes.translate to delete every allowed byte in one pass (at C speed) - if
+# anything is left over, the value contained something else.
+_DIGITS = b"0123456789"
+_INTEGER_CHARS = _DIGITS + b", "
+_FLOAT_CHARS = _DIGITS + b",. "
+
+_TRUE_STRINGS = frozenset({"TRUE", "T", "YES", "Y"})
+_FALSE_STRINGS = frozenset({"FALSE", "F", "NO", "N"})
+_BOOLEAN_STRINGS = _TRUE_STRINGS | _FALSE_STRINGS
+
+# Removes the thousands separators from numbers, in a single pass
+_THOUSANDS_SEPARATORS = str.maketrans("", "", ", ")
+
+
+def _only_contains(value: str, allowed: bytes) -> bool:
+    """Return true if the value is non-empty and made up solely of the allowed
+    (ascii) characters."""
+    return value != "" and value.encode("utf-8").translate(None, allowed) == b""
+
+
+def _looks_like_integer(stripped: str) -> bool:
+    if stripped.startswith("-"):
+        stripped = stripped[1:]
+    return _only_contains(stripped, _INTEGER_CHARS)
+
+
+def _looks_like_float(stripped: str) -> bool:
+    mantissa, e, exponent = stripped.partition("e")
+    if e and not (exponent[:1] in ("-", "+") and _only_contains(exponent[1:], _DIGITS)):
+        return False
+    if mantissa.startswith("-"):
+        mantissa = mantissa[1:]
+    return _only_contains(mantissa, _FLOAT_CHARS)
+
+
+def _looks_like_date(stripped: str) -> bool:
+    return (
+        len(stripped) == 10
+        and stripped[4] == stripped[7] == "-"
+        and _only_contains(stripped[:4] + stripped[5:7] + stripped[8:], _DIGITS)
+    )
+
 
-    and false otherwise."""
-    non_match = False
-    one_match = False
-    for value in values:
-        if regex.match(value):
-            one_match = True
-        elif WHITESPACE_REGEX.match(value):
-            continue
-        else:
-            non_match = True
-            break
-    return (non_match is False) and one_match
+def _looks_like_boolean(upper: str) -> bool:
+    return upper in _BOOLEAN_STRINGS
+
+
+# Values to be sniffed, as (stripped, upper) pairs
+SniffSample = Sequence[Tuple[str, str]]
+
+
+def make_sniff_sample(values: Iterable[str]) -> SniffSample:
+    """Prepare raw values for sniff_column_type.
+
+    Blanks are dropped and the rest are stripped and paired with their
+    uppercase form.  This is done once per value, rather than once per value
+    per type."""
+    stripped_values = (value.strip() for value in values)
+    return [(stripped, stripped.upper()) for stripped in stripped_values if stripped]
+
+
+# The types that can be sniffed, in order of preference, each with a test for a
+# single (stripped, upper) value
+_SNIFFABLE_TYPES: List[Tuple[ColumnType, Callable[[str, str], bool]]] = [
+    (ColumnType.INTEGER, lambda stripped, _: _looks_like_integer(stripped)),
+    (ColumnType.FLOAT, lambda stripped, _: _looks_like_float(stripped)),
+    (ColumnType.BOOLEAN, lambda _, upper: _looks_like_boolean(upper)),
+    (ColumnType.DATE, lambda stripped, _: _looks_like_date(stripped)),
+]
+
+
+def sniff_column_type(sample: SniffSample) -> ColumnType:
+    """Return the type of column suggested by the sample.
+
+    This makes a single pass over the values.  Each value is only tested
+    against the types that all the values before it fitted, so once a type
+    has been ruled out it costs nothing further.  If no type fits (or the
+    sample is empty) the column is TEXT.
+
+    """
+    if len(sample) == 0:
+        return ColumnType.TEXT
+    candidates = _SNIFFABLE_TYPES
+    for stripped, upper in sample:
+        candidates = [
+            (column_type, test)
+            for column_type, test in candidates
+            if test(stripped, upper)
+        ]
+        if len(candidates) == 0:
+            return ColumnType.TEXT
+    return candidates[0][0]
 
 
 def is_null_str(value: str) -> bool:
@@ -51,17 +124,17 @@ def is_null_str(value: str) -> bool:
 
 
 class DateConverter:
-    DATE_REGEX = re.compile(r"^ ?\d{4}-\d{2}-\d{2} ?$")
-    DATE_FORMAT = "%Y-%m-%d"
-
-    def sniff(self, values: Iterable[str]) -> bool:
-        return sniff_and_allow_blanks(self.DATE_REGEX, values)
-
     def convert(self, value: str) -> Optional[date]:
         stripped = value.strip()
         if is_null_str(stripped):
             return None
 
+        # date.fromisoformat is implemented in C and is several times quicker
+        # than slicing out the parts and calling int() on each.  Newer Pythons
+        # accept other ISO formats too (eg: 20180103, 2018-W01-1), so check
+        # the shape first to keep to YYYY-MM-DD everywhere.
+        if not _looks_like_date(stripped):
+            raise exc.UnconvertableValueException(ColumnType.DATE, value)
         try:
             return date.fromisoformat(stripped)
         except ValueError:
@@ -69,81 +142,85 @@ class DateConverter:
 
 
 class IntegerConverter:
-    INTEGER_SNIFF_REGEX = re.compile(r"^(-?(?:\d|,| )+)$")
-    INTEGER_CONVERT_REGEX = re.compile(r"^(-?(?:\d|,| )+)(\.0)?$")
-
-    def sniff(self, values: Iterable[str]) -> bool:
-        return sniff_and_allow_blanks(self.INTEGER_SNIFF_REGEX, values)
-
     def convert(self, value: str) -> Optional[int]:
         stripped = value.strip()
         if is_null_str(stripped):
             return None
-        match = self.INTEGER_CONVERT_REGEX.match(stripped)
-        if not match:
+        # a trailing ".0" is allowed when converting (but not when sniffing)
+        if stripped.endswith(".0"):
+            stripped = stripped[:-2]
+        # int() also accepts things like "+5" and "1_000", so check the shape
+        # first
+        if not _looks_like_integer(stripped):
+            raise exc.UnconvertableValueException(ColumnType.INTEGER, value)
+        try:
+            return int(stripped.translate(_THOUSANDS_SEPARATORS))
+        except ValueError:
             raise exc.UnconvertableValueException(ColumnType.INTEGER, value)
-        return int(match.group(1).replace(",", ""))
 
 
 class FloatConverter:
-    FLOAT_REGEX = re.compile(r"^-?(\d|,|\.| )+(e[-\+]\d+)?$")
-
-    def sniff(self, values: Iterable[str]) -> bool:
-        return sniff_and_allow_blanks(self.FLOAT_REGEX, values)
-
     def convert(self, value: str) -> Optional[float]:
         stripped = value.strip()
         if is_null_str(stripped):
             return None
-        match = self.FLOAT_REGEX.match(stripped)
-        if not match:
+        # float() also accepts things like "inf", "+1.5" and "1E5", so check
+        # the shape first
+        if not _looks_like_float(stripped):
+            raise exc.UnconvertableValueException(ColumnType.FLOAT, value)
+        try:
+            return float(stripped.translate(_THOUSANDS_SEPARATORS))
+        except ValueError:
             raise exc.UnconvertableValueException(ColumnType.FLOAT, value)
-        return float(match.group().replace(",", ""))
 
 
 class BooleanConverter:
-    BOOLEAN_REGEX = re.compile(r"^ ?(TRUE|FALSE|T|F|YES|NO|Y|N) ?$", re.I)
-    TRUE_REGEX = re.compile(r"^(TRUE|T|YES|Y)$", re.I)
-    FALSE_REGEX = re.compile(r"^(FALSE|F|NO|N)$", re.I)
-
-    def sniff(self, values: Iterable[str]) -> bool:
-        return sniff_and_allow_blanks(self.BOOLEAN_REGEX, values)
-
-    def convert(self, value: str) -> Optional[float]:
+    def convert(self, value: str) -> Optional[bool]:
         stripped = value.strip()
         if is_null_str(stripped):
             return None
 
-        false_match = self.FALSE_REGEX.match(stripped)
-        if false_match:
+        upper = stripped.upper()
+        if upper in _FALSE_STRINGS:
             return False
-
-        true_match = self.TRUE_REGEX.match(stripped)
-        if true_match:
+        elif upper in _TRUE_STRINGS:
             return True
 
         raise exc.UnconvertableValueException(ColumnType.BOOLEAN, value)
 
 
-@functools.lru_cache(maxsize=1024)
-def from_string_to_python(
-    column_type: ColumnType, as_string: str
-) -> Optional["PythonType"]:
-    """Parses values from string (ie: csv) into Python objects, according
-    to ColumnType."""
-    if as_string == "" or as_string is None:
-        return None
+def _text_or_none(as_string: str) -> Optional[str]:
+    return as_string if as_string != "" else None
+
+
+def _make_cell_parser(column_type: ColumnType) -> Callable[[str], Optional[PythonType]]:
+    convert: Callable[[str], Optional[PythonType]]
     if column_type is ColumnType.BOOLEAN:
-        bc = conv.BooleanConverter()
-        return bc.convert(as_string)
+        convert = BooleanConverter().convert
     elif column_type is ColumnType.DATE:
-        dc = conv.DateConverter()
-        return dc.convert(as_string)
+        convert = DateConverter().convert
     elif column_type is ColumnType.INTEGER:
-        ic = conv.IntegerConverter()
-        return ic.convert(as_string)
+        convert = IntegerConverter().convert
     elif column_type is ColumnType.FLOAT:
-        fc = conv.FloatConverter()
-        return fc.convert(as_string)
+        convert = FloatConverter().convert
     else:
-        return column_type.python_type()(as_string)
+        convert = _text_or_none
+    return functools.lru_cache(maxsize=1024)(convert)
+
+
+def make_row_parser(
+    columns: Sequence[Column],
+) -> Callable[[Iterable[str]], List[Optional[PythonType]]]:
+    """Return a function that parses rows of strings (ie: csv lines) into
+    Python objects, according to the types of the given columns.
+
+    The converter for each column is picked once, up front, instead of for
+    every cell.
+
+    """
+    cell_parsers = [_make_cell_parser(column.type_) for column in columns]
+
+    def parse_row(row: Iterable[str]) -> List[Optional[PythonType]]:
+        return [parse(value) for parse, value in zip(cell_parsers, row)]
+
+    return parse_row
@@ -4,8 +4,10 @@ import os
 from logging import getLogger
 from typing import Union, Tuple, Type, List, Dict, Set, IO, Optional, Sequence
 import codecs
+import re
 import csv
 import io
+import itertools
 import contextlib
 
 from typing_extensions import Protocol
@@ -31,15 +33,46 @@ UserSubmittedBytes = Union[werkzeug.datastructures.FileStorage, io.BytesIO]
 
 logger = getLogger(__name__)
 
+# bytes fed to the charset detector at a time
+DETECTION_CHUNK_SIZE = 64 * 1024
+
+# Byte order marks and the codecs that go with them.  The utf-32 ones start
+# with the utf-16 ones, so must be checked first.
+BYTE_ORDER_MARKS: Sequence[Tuple[bytes, str]] = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
 
 def byte_buf_to_str_buf(byte_buf: UserSubmittedBytes) -> codecs.StreamReader:
     """Convert a readable byte buffer into a readable str buffer.
 
     Tries to detect the character set along the way, falling back to utf-8."""
+    Reader = codecs.getreader(detect_encoding(byte_buf))
+    return Reader(byte_buf)
+
+
+def detect_encoding(byte_buf: UserSubmittedBytes) -> str:
+    # A byte order mark settles it, no need to run the detector (which can
+    # read up to 1mb)
+    with rewind(byte_buf):
+        head = byte_buf.read(4)
+    for bom, bom_encoding in BYTE_ORDER_MARKS:
+        if head.startswith(bom):
+            logger.info("found byte order mark for %s", bom_encoding)
+            return bom_encoding
+
+    # NOTE: a new detector is made each time on purpose.  They are cheap to
+    # make (well under a microsecond) and cchardet's reset() does not clear
+    # the previous result, so a reused detector reports the last encoding it
+    # saw.
     detector = UniversalDetector()
     with rewind(byte_buf):
-        for line in byte_buf.readlines():
-            detector.feed(line)
+        for chunk in iter(lambda: byte_buf.read(DETECTION_CHUNK_SIZE), b""):
+            detector.feed(chunk)
             if detector.done:
                 break
             if byte_buf.tell() > 1_000_000:
@@ -47,32 +80,116 @@ def byte_buf_to_str_buf(byte_buf: UserSubmittedBytes) -> codecs.StreamReader:
                 break
         logger.info("detected: %s after %d bytes", detector.result, byte_buf.tell())
     if detector.result["encoding"] is not None:
-        encoding = detector.result["encoding"]
+        return detector.result["encoding"]
     else:
         logger.warning("unable to detect charset, assuming utf-8")
-        encoding = "utf-8"
-    Reader = codecs.getreader(encoding)
-    return Reader(byte_buf)
+        return "utf-8"
 
 
-def sniff_csv(
-    csv_buf: UserSubmittedCSVData, sample_size_hint=8192
-) -> Type[csv.Dialect]:
-    """Return csv dialect and a boolean indicating a guess at whether there is
-    a header."""
-    sniffer = csv.Sniffer()
+# A quoted value, with the quote char captured as "quote".  The stdlib uses
+# .*? up to the closing quote, which rescans the rest of the sample from every
+# opening quote that has no closer (quadratic).  This can't run past the next
+# quote char that isn't doubled, so each scan ends at the next quote.
+_QUOTED = r"""(?=(?P<quote>["']))(?:"(?:[^"]|"")*"|'(?:[^']|'')*')"""
 
-    with rewind(csv_buf):
-        try:
-            dialect = sniffer.sniff(csv_buf.read(sample_size_hint))
-            logger.info("sniffed dialect: %s", dialect)
-        except csv.Error:
-            logger.warning("unable to sniff dialect, falling back to excel")
-            dialect = csv.excel
 
+class _FastSniffer(csv.Sniffer):
+    """A csv.Sniffer that doesn't backtrack catastrophically.
+
+    The stdlib's check for doubled quotes uses a regex with several
+    overlapping repeats, which takes seconds (and then minutes) on short,
+    quote-heavy lines.  This is a copy of the stdlib method with that regex
+    rewritten so that the repeats can't overlap: none of them can consume the
+    quote char or the delimiter when the next thing to match is one of those.
+
+    The regexes that find quoted values are rewritten too (see _QUOTED), so
+    the whole method is linear in the size of the sample.
+
+    """
+
+    def _guess_quote_and_delimiter(self, data, delimiters):
+        matches = []
+        for restr in (
+            r"(?P<delim>[^\w\n\"'])(?P<space> ?)" + _QUOTED + r"(?P=delim)",  # ,"...",
+            r"(?:^|\n)" + _QUOTED + r"(?P<delim>[^\w\n\"'])(?P<space> ?)",  #  "...",
+            r"(?P<delim>[^\w\n\"'])(?P<space> ?)" + _QUOTED + r"(?:$|\n)",  # ,"..."
+            r"(?:^|\n)" + _QUOTED + r"(?:$|\n)",  #  "..." (no delim, no space)
+        ):
+            regexp = re.compile(restr, re.DOTALL | re.MULTILINE)
+            matches = regexp.findall(data)
+            if matches:
+                break
+
+        if not matches:
+            # (quotechar, doublequote, delimiter, skipinitialspace)
+            return ("", False, None, 0)
+        quotes: Dict[str, int] = {}
+        delims: Dict[str, int] = {}
+        spaces = 0
+        groupindex = regexp.groupindex
+        for m in matches:
+            n = groupindex["quote"] - 1
+            key = m[n]
+            if key:
+                quotes[key] = quotes.get(key, 0) + 1
+            try:
+                n = groupindex["delim"] - 1
+                key = m[n]
+            except KeyError:
+                continue
+            if key and (delimiters is None or key in delimiters):
+                delims[key] = delims.get(key, 0) + 1
+            try:
+                n = groupindex["space"] - 1
+            except KeyError:
+                continue
+            if m[n]:
+                spaces += 1
+
+        quotechar = max(quotes, key=quotes.__getitem__)
+
+        if delims:
+            delim = max(delims, key=delims.__getitem__)
+            skipinitialspace = delims[delim] == spaces
+            if delim == "\n":  # most likely a file with a single column
+                delim = ""
+        else:
+            # there is *no* delimiter, it's a single column of quoted data
+            delim = ""
+            skipinitialspace = False
+
+        # if we see an extra quote between delimiters, we've got a
+        # double quoted format
+        dq_regexp = re.compile(
+            r"((%(delim)s)|^)[^\w%(delim)s%(quote)s\n]*%(quote)s[^%(delim)s%(quote)s\n]*%(quote)s[^%(delim)s\n]*%(quote)s[^\w%(delim)s%(quote)s\n]*((%(delim)s)|$)"
+            % {"delim": re.escape(delim), "quote": quotechar},
+            re.MULTILINE,
+        )
+
+        doublequote = dq_regexp.search(data) is not None
+
+        return (quotechar, doublequote, delim, skipinitialspace)
+
+
+def sniff_csv(sample: str) -> Type[csv.Dialect]:
+    """Return the csv dialect of the sample (the start of a csv file),
+    falling back to excel."""
+    sniffer = _FastSniffer()
+    try:
+        dialect = sniffer.sniff(sample)
+        logger.info("sniffed dialect: %s", dialect)
+    except csv.Error:
+        logger.warning("unable to sniff dialect, falling back to excel")
+        dialect = csv.excel
     return dialect
 
 
+# How many rows peek_csv looks at, and how many distinct values from each
+# column it keeps to sniff the type from
+PEEK_ROWS = 1000
+PEEK_VALUES_PER_COLUMN = 256
+
+
 def peek_csv(
     csv_buf: UserSubmittedCSVData, existing_columns: Optional[Sequence[Column]] = None
 ) -> Tuple[Type[csv.Dialect], List[Column]]:
@@ -83,19 +200,28 @@ def peek_csv(
     and those are used instead of inferring..
 
     """
-    # FIXME: this should be part of a more robust way to check the size of files
     with rewind(csv_buf):
-        buf = csv_buf.read(2048)
-        if len(buf) == 0 or buf.isspace():
+        # The start of the file is read (and so decoded) just once, and shared
+        # between the blank check, the dialect sniffing and the reader.  It's
+        # read up to the end of a line so that the reader can carry on from
+        # the buffer.
+        sample = csv_buf.read(8192)
+
+        # FIXME: this should be part of a more robust way to check the size of files
+        if len(sample) == 0 or sample[:2048].isspace():
             raise exc.BlankCSVException("blank csv file!")
 
-    with rewind(csv_buf):
-        dialect = sniff_csv(csv_buf)
+        dialect = sniff_csv(sample)
+        sample += csv_buf.readline()
 
         # FIXME: it's probably best that this consider the entire CSV file rather
         # than just the start of it.  there are many, many csv files that, halfway
         # down, switch out "YES" for "YES (but only <...>)"
-        reader = csv.reader(csv_buf, dialect)
+        # StringIO splits the sample on line endings only - str.splitlines
+        # would also split on form feeds, \u2028 and others
+        reader = csv.reader(
+            itertools.chain(io.StringIO(sample, newline=""), csv_buf), dialect
+        )
         headers = [
             header or f"col{i}" for i, header in enumerate(next(reader), start=1)
         ]
@@ -116,25 +242,25 @@ def peek_csv(
                     raise exc.TableDefinitionMismatchException()
             return dialect, columns
 
-        first_few = zip(*(row for row, _ in zip(reader, range(1000))))
-        as_dict: Dict[str, Set[str]] = dict(zip(headers, (set(v) for v in first_few)))
+        # build the distinct values of each column directly, in a single pass,
+        # rather than transposing the rows first.  Both the rows and the
+        # values kept per column are capped, so the work (and memory) is
+        # bounded whatever the size of the file
+        column_values: List[Set[str]] = [set() for _ in headers]
+        for row in itertools.islice(reader, PEEK_ROWS):
+            for column_set, value in zip(column_values, row):
+                if len(column_set) < PEEK_VALUES_PER_COLUMN:
+                    column_set.add(value)
+        as_dict: Dict[str, conv.SniffSample] = dict(
+            zip(headers, (conv.make_sniff_sample(v) for v in column_values))
+        )
 
         cols = []
-        ic = conv.IntegerConverter()
-        dc = conv.DateConverter()
-        fc = conv.FloatConverter()
-        bc = conv.BooleanConverter()
         for key, values in as_dict.items():
-            if key == "csvbase_row_id" or ic.sniff(values):
+            if key == "csvbase_row_id":
                 cols.append(Column(key, ColumnType.INTEGER))
-            elif fc.sniff(values):
-                cols.append(Column(key, ColumnType.FLOAT))
-            elif bc.sniff(values):
-                cols.append(Column(key, ColumnType.BOOLEAN))
-            elif dc.sniff(values):
-                cols.append(Column(key, ColumnType.DATE))
             else:
-                cols.append(Column(key, ColumnType.TEXT))
+                cols.append(Column(key, conv.sniff_column_type(values)))
         logger.info("inferred: %s", cols)
 
     return dialect, cols
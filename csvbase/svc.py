@@ -44,7 +44,7 @@ from .value_objs import (
     Column,
     ColumnType,
     DataLicence,
-    Row,
+    RowMapping,
     Table,
     User,
     RowCount,
@@ -308,7 +308,7 @@ def set_readme_markdown(
         table.readme_obj.readme_markdown = bleached
 
 
-def get_a_made_up_row(sesh: Session, table_uuid: UUID) -> Row:
+def get_a_made_up_row(sesh: Session, table_uuid: UUID) -> RowMapping:
     columns = PGUserdataAdapter.get_columns(sesh, table_uuid)
     return {c: c.type_.example() for c in columns}
 
@@ -55,10 +55,8 @@ def csv_to_rows(
     reader = csv.reader(csv_buf, dialect)
     # FIXME: check that contents of this header matches the columns
     header = next(reader)  # pop the header, which is not useful
-    row_gen = (
-        [conv.from_string_to_python(col.type_, v) for col, v in zip(columns, line)]
-        for line in reader
-    )
+    parse_row = conv.make_row_parser(columns)
+    row_gen = (parse_row(line) for line in reader)
     return row_gen
 
 
@@ -35,7 +35,7 @@ from .value_objs import (
     KeySet,
     Page,
     PythonType,
-    Row,
+    RowMapping,
     Table,
 )
 from .streams import UserSubmittedCSVData
@@ -121,7 +121,9 @@ class PGUserdataAdapter:
         return rv
 
     @classmethod
-    def get_row(cls, sesh: Session, table_uuid: UUID, row_id: int) -> Optional[Row]:
+    def get_row(
+        cls, sesh: Session, table_uuid: UUID, row_id: int
+    ) -> Optional[RowMapping]:
         columns = cls.get_columns(sesh, table_uuid)
         table_clause = cls._get_userdata_tableclause(sesh, table_uuid)
         cursor = sesh.execute(
@@ -169,7 +171,7 @@ class PGUserdataAdapter:
         return cursor.fetchone()
 
     @classmethod
-    def get_a_sample_row(cls, sesh: Session, table_uuid: UUID) -> Row:
+    def get_a_sample_row(cls, sesh: Session, table_uuid: UUID) -> RowMapping:
         """Returns a sample row from the table (the lowest row id).
 
         If none exist, a made-up row is returned.  This function is for
@@ -185,7 +187,7 @@ class PGUserdataAdapter:
             return {c: row._mapping[c.name] for c in columns}
 
     @classmethod
-    def insert_row(cls, sesh: Session, table_uuid: UUID, row: Row) -> int:
+    def insert_row(cls, sesh: Session, table_uuid: UUID, row: RowMapping) -> int:
         table = cls._get_userdata_tableclause(sesh, table_uuid)
         values = {c.name: v for c, v in row.items()}
         return sesh.execute(
@@ -198,7 +200,7 @@ class PGUserdataAdapter:
         sesh: Session,
         table_uuid: UUID,
         row_id: int,
-        row: Row,
+        row: RowMapping,
     ) -> bool:
         """Update a given row, returning True if it existed (and was updated) and False otherwise."""
         table = cls._get_userdata_tableclause(sesh, table_uuid)
@@ -271,10 +273,9 @@ class PGUserdataAdapter:
                 ).scalar()
                 has_less = False
 
-        rows = [
-            {c: row_tup._mapping[c.name] for c in table.columns}
-            for row_tup in row_tuples
-        ]
+        # the table clause is made from the same columns as the table (in the
+        # same order) so the result rows are already in column order
+        rows = [tuple(row_tup) for row_tup in row_tuples]
 
         return Page(
             has_less=has_less,
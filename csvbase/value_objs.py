@@ -11,11 +11,12 @@ from typing import (
     Set,
     cast,
     Any,
+    TypeVar,
 )
 from typing_extensions import Literal
 from uuid import UUID
 from datetime import datetime, date, timedelta, timezone
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 import enum
 import binascii
 
@@ -24,11 +25,54 @@ from sqlalchemy import types as satypes
 
 logger = getLogger(__name__)
 
-# Preliminary version of a Row.  Another option would be to subclass tuple and
-# implement __getattr__ to provide access by column
-Row = Mapping["Column", Optional["PythonType"]]
+T = TypeVar("T")
 
 
+def slots(cls: Type[T]) -> Type[T]:
+    """Give a dataclass __slots__ instead of a __dict__, making instances
+    smaller and attribute access quicker.
+
+    A backport of dataclass(slots=True), which needs Python 3.10.  Goes above
+    the @dataclass decorator.
+
+    """
+    field_names = tuple(field.name for field in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for field_name in field_names:
+        # defaults are already baked into __init__, and would clash
+        cls_dict.pop(field_name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    metaclass: Any = type(cls)
+    slotted_cls: Type[T] = metaclass(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    if getattr(cls, "__dataclass_params__").frozen:
+        # pickle restores slots with setattr, which frozen dataclasses refuse
+        setattr(slotted_cls, "__getstate__", _get_slots_state)
+        setattr(slotted_cls, "__setstate__", _set_slots_state)
+    return slotted_cls
+
+
+def _get_slots_state(self) -> List[Any]:
+    return [getattr(self, name) for name in self.__slots__]
+
+
+def _set_slots_state(self, state: List[Any]) -> None:
+    for name, value in zip(self.__slots__, state):
+        object.__setattr__(self, name, value)
+
+
+# A row is a plain tuple, in the same order as the table's columns (so the
+# csvbase_row_id is always first).  Use Table.column_index to find a column's
+# position.
+Row = Tuple[Optional["PythonType"], ...]
+
+# A single row keyed by column, for when one row is read or written on its own
+RowMapping = Mapping["Column", Optional["PythonType"]]
+
+
+@slots
 @dataclass
 class User:
     user_uuid: UUID
@@ -51,6 +95,7 @@ class User:
             return timezone.utc
 
 
+@slots
 @dataclass
 class KeySet:
     """Used as a selector for keyset pagination
@@ -89,6 +134,7 @@ class KeySet:
 #     LTE = 6
 
 
+@slots
 @dataclass
 class Page:
     """A page from a table"""
@@ -101,9 +147,10 @@ class Page:
     rows: Sequence[Row]
 
     def row_ids(self) -> Set[int]:
-        return cast(Set[int], {row[ROW_ID_COLUMN] for row in self.rows})
+        return cast(Set[int], {row[0] for row in self.rows})
 
 
+@slots
 @dataclass
 class RowCount:
     exact: Optional[int]
@@ -113,6 +160,7 @@ class RowCount:
         return self.exact or self.approx
 
 
+@slots
 @dataclass
 class Table:
     table_uuid: UUID
@@ -125,6 +173,10 @@ class Table:
     created: datetime
     row_count: RowCount
     last_changed: datetime
+    column_index: Mapping["Column", int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.column_index = {column: i for i, column in enumerate(self.columns)}
 
     def has_caption(self) -> bool:
         return len(self.caption.strip()) > 0
@@ -190,6 +242,13 @@ class ColumnType(enum.Enum):
     BOOLEAN = 4
     DATE = 5
 
+    # Looked up once per member, at import (see below the maps), so that the
+    # methods don't have to hash the enum (which happens in Python) each time
+    _sqla_type: Type["SQLAlchemyType"]
+    _pretty_name: str
+    _python_type: Type
+    _pretty_type: str
+
     def example(self) -> "PythonType":
         if self is ColumnType.TEXT:
             return "foo"
@@ -208,18 +267,18 @@ class ColumnType(enum.Enum):
 
     def sqla_type(self) -> Type["SQLAlchemyType"]:
         """The equivalent SQLAlchemy type"""
-        return _SQLA_TYPE_MAP[self]
+        return self._sqla_type
 
     def pretty_name(self) -> str:
         """The presentation name of the type.  Intended for UIs."""
-        return self.name.capitalize()
+        return self._pretty_name
 
     def python_type(self) -> Type:
-        return _PYTHON_TYPE_MAP[self]
+        return self._python_type
 
     def pretty_type(self) -> str:
         """The "pretty" name of the type.  Intended for APIs."""
-        return _PRETTY_TYPE_MAP[self]
+        return self._pretty_type
 
 
 PythonType = Union[int, bool, float, date, str, None]
@@ -264,7 +323,15 @@ _PRETTY_TYPE_MAP = {
     ColumnType.DATE: "date",
 }
 
+for _column_type in ColumnType:
+    _column_type._sqla_type = _SQLA_TYPE_MAP[_column_type]
+    _column_type._pretty_name = _column_type.name.capitalize()
+    _column_type._python_type = _PYTHON_TYPE_MAP[_column_type]
+    _column_type._pretty_type = _PRETTY_TYPE_MAP[_column_type]
+del _column_type
+
 
+@slots
 @dataclass(frozen=True)
 class Column:
     name: str
@@ -284,15 +351,19 @@ class ContentType(enum.Enum):
     PARQUET = "application/parquet"  # this is unofficial, but convenient
     XLSX = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 
+    # Set at import, below the maps (as for ColumnType)
+    _pretty_name: str
+    _file_extension: str
+
     @classmethod
     def from_file_extension(cls, file_extension: str) -> Optional["ContentType"]:
         return EXTENSION_MAP.get(file_extension)
 
     def pretty_name(self) -> str:
-        return PRETTY_NAME_MAP[self]
+        return self._pretty_name
 
     def file_extension(self) -> str:
-        return EXTENSION_MAP_REVERSE[self]
+        return self._file_extension
 
 
 EXTENSION_MAP: Mapping[str, ContentType] = {
@@ -316,13 +387,21 @@ PRETTY_NAME_MAP: Mapping[ContentType, str] = {
     ContentType.XLSX: "MS Excel",
 }
 
+for _content_type, _pretty_name in PRETTY_NAME_MAP.items():
+    _content_type._pretty_name = _pretty_name
+for _content_type, _file_extension in EXTENSION_MAP_REVERSE.items():
+    _content_type._file_extension = _file_extension
+del _content_type, _pretty_name, _file_extension
+
 
+@slots
 @dataclass
 class Quota:
     private_tables: int
     private_bytes: int
 
 
+@slots
 @dataclass
 class Usage:
     """Represents the actual usage of a user - to be compared against their
@@ -6,7 +6,15 @@ from csvbase import exc
 from csvbase.svc import get_table, create_table_metadata, user_by_name
 from csvbase.config import get_config
 from csvbase.userdata import PGUserdataAdapter
-from csvbase.value_objs import Column, ColumnType, KeySet, Row, DataLicence
+from csvbase.value_objs import (
+    Column,
+    ColumnType,
+    KeySet,
+    Row,
+    RowMapping,
+    DataLicence,
+    Table,
+)
 
 from .value_objs import Post
 
@@ -22,17 +30,12 @@ BLOG_COLUMNS = [
 ]
 
 
-def post_from_row(row: Row) -> Post:
-    kwargs = {}
-    for column, val in row.items():
-        if column.name == "csvbase_row_id":
-            kwargs["id"] = val
-            continue
-        kwargs[column.name] = val
-    return Post(**kwargs)  # type: ignore
+def post_from_row(table: Table, row: Row) -> Post:
+    kwargs = {column.name: row[table.column_index[column]] for column in BLOG_COLUMNS}
+    return Post(id=row[0], **kwargs)  # type: ignore
 
 
-def post_to_row(post: Post) -> Row:
+def post_to_row(post: Post) -> RowMapping:
     row = {col: getattr(post, col.name) for col in BLOG_COLUMNS}
     row[Column("csvbase_row_id", ColumnType.INTEGER)] = post.id
     return row
@@ -57,7 +60,7 @@ def get_posts(sesh) -> Sequence[Post]:
     )
     posts = []
     for row in page.rows:
-        posts.append(post_from_row(row))
+        posts.append(post_from_row(table, row))
     return sorted(posts, key=lambda p: p.posted or date(1970, 1, 1), reverse=True)
 
 
@@ -67,7 +70,7 @@ def get_post(sesh, post_id: int) -> Post:
     row = PGUserdataAdapter.get_row(sesh, table.table_uuid, post_id)
     if row is None:
         raise exc.RowDoesNotExistException(username, table_name, post_id)
-    return post_from_row(row)
+    return post_from_row(table, tuple(row[column] for column in table.columns))
 
 
 def insert_post(sesh, post: Post) -> None:
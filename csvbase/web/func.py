@@ -16,10 +16,17 @@ logger = getLogger(__name__)
 
 
 def is_browser() -> bool:
+    # this is called several times per request, so the answer is kept in the
+    # request's environ (g can outlive the request)
+    if "csvbase.is_browser" in request.environ:
+        return request.environ["csvbase.is_browser"]
+
     # bit of content negotiation magic
     accepts = werkzeug.http.parse_accept_header(request.headers.get("Accept"))
     best = accepts.best_match(["text/html", "text/csv"], default="text/csv")
-    return best == "text/html"
+    answer = best == "text/html"
+    request.environ["csvbase.is_browser"] = answer
+    return answer
 
 
 def set_current_user(user: User) -> None:
@@ -7,6 +7,7 @@ from logging import getLogger
 from typing import (
     Any,
     Dict,
+    Iterable,
     List,
     Mapping,
     Optional,
@@ -64,7 +65,7 @@ from ...value_objs import (
     KeySet,
     Page,
     PythonType,
-    Row,
+    RowMapping,
     Table,
     User,
 )
@@ -546,7 +547,6 @@ def make_table_view_response(sesh, content_type: ContentType, table: Table) -> R
                 table=table,
                 page=page,
                 keyset=keyset,
-                ROW_ID_COLUMN=ROW_ID_COLUMN,
                 praise_id=get_praise_id_if_exists(table),
                 is_first_page=is_first_page,
                 is_last_page=is_last_page,
@@ -725,7 +725,11 @@ def get_table_apidocs(username: str, table_name: str) -> str:
 
     made_up_row = svc.get_a_made_up_row(sesh, table.table_uuid)
     sample_row = PGUserdataAdapter.get_a_sample_row(sesh, table.table_uuid)
-    sample_page = Page(has_less=False, has_more=True, rows=[sample_row])
+    sample_page = Page(
+        has_less=False,
+        has_more=True,
+        rows=[tuple(sample_row[column] for column in table.columns)],
+    )
 
     return render_template(
         "table_api.html",
@@ -993,7 +997,7 @@ def create_row(username: str, table_name: str) -> Response:
         else:
             raise exc.NotAuthenticatedException()
 
-    row: Row
+    row: RowMapping
     if request.mimetype == ContentType.JSON.value:
         row_as_dict = json_or_400()["row"]
         row = {c: row_as_dict[c.name] for c in table.user_columns()}
@@ -1192,7 +1196,7 @@ def update_row_by_form_post(username: str, table_name: str, row_id: int) -> Resp
 
     sesh = get_sesh()
     table = svc.get_table(sesh, username, table_name)
-    row: Row = {
+    row: RowMapping = {
         c: from_html_form_to_python(c.type_, request.form.get(c.name))
         for c in table.columns
     }
@@ -1472,16 +1476,30 @@ def keyset_from_request_args() -> KeySet:
     return keyset
 
 
-def row_to_json_dict(table: Table, row: Row, omit_row_id=False) -> Dict[str, Any]:
+def row_to_json_dict(
+    table: Table, row: RowMapping, omit_row_id=False
+) -> Dict[str, Any]:
     # FIXME: rename "omit_row_id" to "as_though_unsubmitted" or something
-    row_without_row_id = (c for c in row.items() if c[0].name != "csvbase_row_id")
+    row_id = None if omit_row_id else row_id_from_row(row)
+    return _row_items_to_json_dict(table, row.items(), row_id)
+
+
+def _row_items_to_json_dict(
+    table: Table,
+    items: Iterable[Tuple[Column, "PythonType"]],
+    row_id: Optional[int],
+) -> Dict[str, Any]:
+    """Build the json for a row from its (column, value) pairs, so that rows
+    don't have to be in a mapping first.  The row id (and url) is only
+    included when given."""
     json_dict: Dict = {
         "row": {
-            column.name: value_to_json(value) for column, value in row_without_row_id
+            column.name: value_to_json(value)
+            for column, value in items
+            if column.name != "csvbase_row_id"
         },
     }
-    if not omit_row_id:
-        row_id = row_id_from_row(row)
+    if row_id is not None:
         json_dict["row_id"] = row_id
         json_dict["url"] = url_for(
             "csvbase.get_row",
@@ -1494,13 +1512,16 @@ def row_to_json_dict(table: Table, row: Row, omit_row_id=False) -> Dict[str, Any
     return json_dict
 
 
-def row_id_from_row(row: Row) -> int:
+def row_id_from_row(row: RowMapping) -> int:
     return cast(int, row[ROW_ID_COLUMN])
 
 
 def page_to_json_dict(table: Table, page: Page) -> Dict[str, Any]:
     rv: Dict[str, Any] = {}
-    rv["rows"] = [row_to_json_dict(table, row) for row in page.rows]
+    rv["rows"] = [
+        _row_items_to_json_dict(table, zip(table.columns, row), cast(int, row[0]))
+        for row in page.rows
+    ]
     if page.has_less:
         # FIXME: these url_fors should be shared with the table_view template
         rv["previous_page_url"] = url_for(
@@ -1508,7 +1529,7 @@ def page_to_json_dict(table: Table, page: Page) -> Dict[str, Any]:
             username=table.username,
             table_name=table.table_name,
             op="lt",
-            n=page.rows[-1][ROW_ID_COLUMN],
+            n=page.rows[-1][0],
             _external=True,
         )
     else:
@@ -1520,7 +1541,7 @@ def page_to_json_dict(table: Table, page: Page) -> Dict[str, Any]:
             username=table.username,
             table_name=table.table_name,
             op="gt",
-            n=page.rows[-1][ROW_ID_COLUMN],
+            n=page.rows[-1][0],
             _external=True,
         )
     else:
@@ -84,8 +84,7 @@ def ten_rows(test_user, sesh) -> Table:
     ]
 
     table = create_table(sesh, test_user, columns, caption="Roman numerals")
-    for row in data:
-        PGUserdataAdapter.insert_row(sesh, table.table_uuid, dict(zip(columns, row)))
+    PGUserdataAdapter.insert_table_data(sesh, table, columns, data)
     sesh.commit()
     return table
 
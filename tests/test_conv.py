@@ -8,24 +8,10 @@ from csvbase.conv import (
     IntegerConverter,
     FloatConverter,
     BooleanConverter,
+    make_sniff_sample,
+    sniff_column_type,
 )
-
-
-@pytest.mark.parametrize(
-    "inp, expected",
-    [
-        pytest.param(["2018-01-03"], True, id="iso"),
-        pytest.param([" 2018-01-03"], True, id="with whitespace (1)"),
-        pytest.param(["2018-01-03 "], True, id="with whitespace (2)"),
-        pytest.param([" 2018-01-03 "], True, id="with whitespace (3)"),
-        pytest.param(["2018-01-03T00:00:00"], False, id="datetime without zone"),
-        pytest.param(["2018-01-03", ""], True, id="one missing value"),
-        pytest.param([""], False, id="all missing values"),
-    ],
-)
-def test_DateConverter__sniff(inp, expected):
-    dc = DateConverter()
-    assert dc.sniff(inp) is expected
+from csvbase.value_objs import ColumnType
 
 
 @pytest.mark.parametrize(
@@ -45,27 +31,13 @@ def test_DateConverter__convert(inp, expected):
     assert dc.convert(inp) == expected
 
 
-def test_DateConverter__convert_failure():
-    dc = DateConverter()
-    with pytest.raises(exc.UnconvertableValueException):
-        dc.convert("nonsense")
-
-
 @pytest.mark.parametrize(
-    "inp, expected",
-    [
-        pytest.param(["1"], True, id="an int"),
-        pytest.param(["-1"], True, id="a negative int"),
-        pytest.param(["1000"], True, id="thousand"),
-        pytest.param(["1,000"], True, id="financial thousand"),
-        pytest.param([" 1,000 "], True, id="whitespace"),
-        pytest.param(["-1,000 "], True, id="negative financial"),
-        pytest.param(["1.0"], False, id="float not ok when sniffing"),
-    ],
+    "inp", ["nonsense", "20180103", "2018-13-01", "2018-01-3", "2018-W01-1"]
 )
-def test_IntegerConverter__sniff(inp, expected):
-    ic = IntegerConverter()
-    assert ic.sniff(inp) is expected
+def test_DateConverter__convert_failure(inp):
+    dc = DateConverter()
+    with pytest.raises(exc.UnconvertableValueException):
+        dc.convert(inp)
 
 
 @pytest.mark.parametrize(
@@ -78,6 +50,8 @@ def test_IntegerConverter__sniff(inp, expected):
         pytest.param(" 1,000 ", 1000, id="whitespace"),
         pytest.param("-1,000 ", -1000, id="negative financial"),
         pytest.param("1.0", 1, id="float ok when converting"),
+        pytest.param("-1,000.0", -1000, id="negative financial, as float"),
+        pytest.param("1 000", 1000, id="space as thousands separator"),
         pytest.param(" ", None, id="whitespace"),
         pytest.param("", None, id="blank"),
     ],
@@ -87,30 +61,13 @@ def test_IntegerConverter__convert(inp, expected):
     assert ic.convert(inp) == expected
 
 
-def test_IntegerConverter__convert_failure():
-    ic = IntegerConverter()
-    with pytest.raises(exc.UnconvertableValueException):
-        ic.convert("nonsense")
-
-
 @pytest.mark.parametrize(
-    "inp, expected",
-    [
-        pytest.param(["1.0"], True, id="an float"),
-        pytest.param(["-1.0"], True, id="a negative int"),
-        pytest.param(["1."], True, id="a float (no trailing 0)"),
-        pytest.param(["1"], True, id="an int (works ok)"),
-        pytest.param(["1000.0"], True, id="thousand"),
-        pytest.param(["1,000.0"], True, id="financial thousand"),
-        pytest.param([" 1,000.0 "], True, id="whitespace"),
-        pytest.param(["-1,000.0 "], True, id="negative financial"),
-        pytest.param(["9.999999974e-07"], True, id="scientific"),
-        pytest.param(["9.999999974e+07"], True, id="scientific 2"),
-    ],
+    "inp", ["nonsense", "1_000", "+5", "1.5", "1.0.0", "-", "1-", ", ", "1e5"]
 )
-def test_FloatConverter__sniff(inp, expected):
-    ic = FloatConverter()
-    assert ic.sniff(inp) is expected
+def test_IntegerConverter__convert_failure(inp):
+    ic = IntegerConverter()
+    with pytest.raises(exc.UnconvertableValueException):
+        ic.convert(inp)
 
 
 @pytest.mark.parametrize(
@@ -135,10 +92,13 @@ def test_FloatConverter__convert(inp, expected):
     assert ic.convert(inp) == expected
 
 
-def test_FloatConverter__convert_failure():
+@pytest.mark.parametrize(
+    "inp", ["nonsense", "inf", "infinity", "1_0.5", "+1.5", "1E5", "1e5", "1.2.3"]
+)
+def test_FloatConverter__convert_failure(inp):
     ic = FloatConverter()
     with pytest.raises(exc.UnconvertableValueException):
-        ic.convert("nonsense")
+        ic.convert(inp)
 
 
 def casings(c):
@@ -154,19 +114,6 @@ def casings(c):
     ]
 
 
-@pytest.mark.parametrize(
-    "inp, expected",
-    [
-        pytest.param([item], True)
-        for subl in [casings("true"), casings("false"), casings("yes"), casings("no")]
-        for item in subl
-    ],
-)
-def test_BooleanConverter__sniff(inp, expected):
-    ic = BooleanConverter()
-    assert ic.sniff(inp) is expected
-
-
 @pytest.mark.parametrize(
     "inp, expected",
     [
@@ -191,6 +138,58 @@ def test_BooleanConverter__convert_failure():
         ic.convert("nonsense")
 
 
+@pytest.mark.parametrize(
+    "inp, expected",
+    [
+        pytest.param(["1", "-2", "1,000"], ColumnType.INTEGER, id="integers"),
+        pytest.param(["1", "2.5"], ColumnType.FLOAT, id="ints and floats"),
+        pytest.param(["yes", "N", ""], ColumnType.BOOLEAN, id="booleans"),
+        pytest.param(["2018-01-03", " "], ColumnType.DATE, id="dates"),
+        pytest.param(["1", "2018-01-03"], ColumnType.TEXT, id="ints and dates"),
+        pytest.param(["1", "yes"], ColumnType.TEXT, id="ints and booleans"),
+        pytest.param(["hello"], ColumnType.TEXT, id="text"),
+        pytest.param(["1", "hello"], ColumnType.TEXT, id="one word"),
+        pytest.param(["ÿes"], ColumnType.TEXT, id="non-ascii"),
+        pytest.param([""], ColumnType.TEXT, id="blank"),
+        # dates
+        pytest.param(["2018-01-03"], ColumnType.DATE, id="iso date"),
+        pytest.param([" 2018-01-03"], ColumnType.DATE, id="date whitespace (1)"),
+        pytest.param(["2018-01-03 "], ColumnType.DATE, id="date whitespace (2)"),
+        pytest.param([" 2018-01-03 "], ColumnType.DATE, id="date whitespace (3)"),
+        pytest.param(["2018-01-03T00:00:00"], ColumnType.TEXT, id="datetime"),
+        pytest.param(["2018-01-03", ""], ColumnType.DATE, id="one missing date"),
+        # integers
+        pytest.param(["1"], ColumnType.INTEGER, id="an int"),
+        pytest.param(["-1"], ColumnType.INTEGER, id="a negative int"),
+        pytest.param(["1000"], ColumnType.INTEGER, id="thousand"),
+        pytest.param(["1,000"], ColumnType.INTEGER, id="financial thousand"),
+        pytest.param([" 1,000 "], ColumnType.INTEGER, id="int whitespace"),
+        pytest.param(["-1,000 "], ColumnType.INTEGER, id="negative financial"),
+        pytest.param(["1.0"], ColumnType.FLOAT, id="float not int when sniffing"),
+        pytest.param(["-"], ColumnType.TEXT, id="just a minus sign"),
+        pytest.param(["1", " "], ColumnType.INTEGER, id="one blank int"),
+        # floats
+        pytest.param(["-1.0"], ColumnType.FLOAT, id="a negative float"),
+        pytest.param(["1."], ColumnType.FLOAT, id="a float (no trailing 0)"),
+        pytest.param(["1,000.0"], ColumnType.FLOAT, id="financial float"),
+        pytest.param([" -1,000.0 "], ColumnType.FLOAT, id="negative financial float"),
+        pytest.param(["9.999999974e-07"], ColumnType.FLOAT, id="scientific"),
+        pytest.param(["9.999999974e+07"], ColumnType.FLOAT, id="scientific 2"),
+        pytest.param(["9.999999974e07"], ColumnType.TEXT, id="scientific no sign"),
+        pytest.param(["1.0-"], ColumnType.TEXT, id="trailing minus"),
+        pytest.param(["1", "-1,000.0", "9.9e-07"], ColumnType.FLOAT, id="numbers"),
+    ]
+    # booleans
+    + [
+        pytest.param([item], ColumnType.BOOLEAN, id=f"boolean {item!r}")
+        for subl in [casings("true"), casings("false"), casings("yes"), casings("no")]
+        for item in subl
+    ],
+)
+def test_sniff_column_type(inp, expected):
+    assert sniff_column_type(make_sniff_sample(inp)) is expected
+
+
 @pytest.mark.parametrize(
     "Converter", [BooleanConverter, DateConverter, FloatConverter, IntegerConverter]
 )
@@ -43,7 +43,7 @@ def letters_table(test_user, module_sesh) -> Table:
 
 
 def rows_to_alist(rows):
-    return [tuple(row.values()) for row in rows]
+    return [tuple(row) for row in rows]
 
 
 csvbase_row_id_col = Column("csvbase_row_id", ColumnType.INTEGER)
@@ -1,11 +1,21 @@
+import codecs
 from pathlib import Path
-from io import StringIO
+from io import StringIO, BytesIO
 
 import pytest
 
 from csvbase import exc
 from csvbase.value_objs import Column, ColumnType
-from csvbase.streams import peek_csv, rewind
+from csvbase.streams import (
+    PEEK_ROWS,
+    PEEK_VALUES_PER_COLUMN,
+    byte_buf_to_str_buf,
+    detect_encoding,
+    file_length,
+    peek_csv,
+    rewind,
+    sniff_csv,
+)
 
 test_data = Path(__file__).resolve().parent / "test-data"
 
@@ -42,6 +52,52 @@ def test_peek_csv(input_filename, expected_columns):
     assert actual_columns == expected_columns
 
 
+@pytest.mark.parametrize("line_ending", ["\n", "\r\n", "\r"])
+def test_peek_csv__longer_than_sample(line_ending):
+    lines = ["a,b,c"] + [f"{n},{n/2},x" for n in range(2000)]
+    buf = StringIO(line_ending.join(lines) + line_ending, newline="")
+    _, actual_columns = peek_csv(buf)
+    assert actual_columns == [
+        Column("a", ColumnType.INTEGER),
+        Column("b", ColumnType.FLOAT),
+        Column("c", ColumnType.TEXT),
+    ]
+    assert buf.tell() == 0
+
+
+def test_peek_csv__sample_is_bounded():
+    # "a" has more distinct values than are kept per column, and "b" has a
+    # non-integer after the rows that are looked at; neither is seen
+    lines = ["a,b"]
+    lines += [f"{n},1" for n in range(PEEK_VALUES_PER_COLUMN)]
+    lines += [f"x,{n}" for n in range(PEEK_ROWS - PEEK_VALUES_PER_COLUMN)]
+    lines += ["x,x"]
+    _, actual_columns = peek_csv(StringIO("\n".join(lines) + "\n"))
+    assert actual_columns == [
+        Column("a", ColumnType.INTEGER),
+        Column("b", ColumnType.INTEGER),
+    ]
+
+
+def test_peek_csv__unicode_line_separators_in_values():
+    buf = StringIO("a,b\n" + "1,x\u2028y\n" * 5 + "2,z\n")
+    _, actual_columns = peek_csv(buf)
+    assert actual_columns == [
+        Column("a", ColumnType.INTEGER),
+        Column("b", ColumnType.TEXT),
+    ]
+
+
+def test_peek_csv__ragged_rows():
+    buf = StringIO("a,b,c\n1,2,3\n4,5\n")
+    _, actual_columns = peek_csv(buf)
+    assert actual_columns == [
+        Column("a", ColumnType.INTEGER),
+        Column("b", ColumnType.INTEGER),
+        Column("c", ColumnType.INTEGER),
+    ]
+
+
 @pytest.mark.parametrize(
     "input_filename, expected_exception",
     [("empty.csv", exc.BlankCSVException)],
@@ -53,6 +109,49 @@ def test_peek_csv_with_junk(input_filename, expected_exception):
             peek_csv(input_f)
 
 
+def test_sniff_csv__many_quotes():
+    # the stdlib's sniffer takes minutes to get through this
+    dialect = sniff_csv('a,"b",c\n1,"2",3\n,' + '"' * 500 + "x\n")
+    assert dialect.delimiter == ","
+    assert dialect.quotechar == '"'
+
+
+def test_sniff_csv__unclosed_quotes():
+    # the stdlib's sniffer rescans the rest of the sample from every one of
+    # these opening quotes
+    dialect = sniff_csv("a,b\n" + ', "x' * 2048)
+    assert dialect.delimiter == ","
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-16", "utf-8-sig", "utf-32"])
+def test_byte_buf_to_str_buf(encoding):
+    expected = "name,city\n" + "Jürgen,Köln\n" * 100
+    byte_buf = BytesIO(expected.encode(encoding))
+    str_buf = byte_buf_to_str_buf(byte_buf)
+    assert str_buf.read() == expected
+
+
+@pytest.mark.parametrize(
+    "inp, expected",
+    [
+        pytest.param(codecs.BOM_UTF8 + b"a,b\n", "utf-8-sig", id="utf-8"),
+        pytest.param("a,b\n".encode("utf-16"), "utf-16", id="utf-16"),
+        pytest.param("a,b\n".encode("utf-32"), "utf-32", id="utf-32"),
+    ],
+)
+def test_detect_encoding__byte_order_marks(inp, expected):
+    assert detect_encoding(BytesIO(inp)) == expected
+
+
+def test_byte_buf_to_str_buf__one_after_another():
+    ascii_buf = BytesIO(b"a,b\n1,2\n")
+    assert byte_buf_to_str_buf(ascii_buf).read() == "a,b\n1,2\n"
+
+    expected = "name,city\n" + "Jürgen,Köln\n" * 100
+    utf8_buf = BytesIO(expected.encode("utf-8"))
+    assert byte_buf_to_str_buf(utf8_buf).read() == expected
+
+
 def test_rewind():
     buf = StringIO("hello")
     with rewind(buf):
@@ -61,3 +160,10 @@ def test_rewind():
         assert buf.tell() == 3
 
     assert buf.tell() == 0
+
+
+def test_file_length__in_memory():
+    buf = BytesIO(b"hello")
+    buf.read(2)
+    assert file_length(buf) == 5
+    assert buf.tell() == 0
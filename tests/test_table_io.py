@@ -1,3 +1,6 @@
+from datetime import date
+from io import StringIO
+
 from csvbase.value_objs import Column, ColumnType
 from csvbase import table_io
 
@@ -10,3 +13,25 @@ def test_scientific_notation_not_put_into_csv():
     csv_str = buf.getvalue()
 
     assert csv_str == b"a_float\r\n0.000001\r\n"
+
+
+def test_csv_to_rows():
+    columns = [
+        Column("a_text", type_=ColumnType.TEXT),
+        Column("an_int", type_=ColumnType.INTEGER),
+        Column("a_float", type_=ColumnType.FLOAT),
+        Column("a_bool", type_=ColumnType.BOOLEAN),
+        Column("a_date", type_=ColumnType.DATE),
+    ]
+    csv_buf = StringIO(
+        "a_text,an_int,a_float,a_bool,a_date\n"
+        'hello,"1,000",1.5,yes,2018-01-03\n'
+        ",,,,\n"
+    )
+
+    rows = list(table_io.csv_to_rows(csv_buf, columns, "excel"))
+
+    assert rows == [
+        ["hello", 1000, 1.5, True, date(2018, 1, 3)],
+        [None, None, None, None, None],
+    ]
@@ -1,7 +1,18 @@
 import itertools
+import pickle
+from datetime import datetime
+from uuid import UUID
 
-from csvbase.value_objs import ColumnType
-from csvbase.conv import from_string_to_python
+from csvbase.value_objs import (
+    ROW_ID_COLUMN,
+    Column,
+    ColumnType,
+    DataLicence,
+    Page,
+    RowCount,
+    Table,
+)
+from csvbase.conv import make_row_parser
 
 import pytest
 
@@ -25,4 +36,32 @@ def _make_versions(inp, expected):
     ),
 )
 def test_bool_parsing_from_string(bool_str, expected):
-    assert from_string_to_python(ColumnType.BOOLEAN, bool_str) == expected
+    parse_row = make_row_parser([Column("a", ColumnType.BOOLEAN)])
+    assert parse_row([bool_str]) == [expected]
+
+
+def test_column__slots_and_pickling():
+    column = Column("a", ColumnType.TEXT)
+    assert not hasattr(column, "__dict__")
+    assert pickle.loads(pickle.dumps(column)) == column
+
+
+def test_table__column_index_and_page_row_ids():
+    a = Column("a", ColumnType.TEXT)
+    table = Table(
+        UUID("f" * 32),
+        username="someone",
+        table_name="a-table",
+        is_public=False,
+        caption="",
+        data_licence=DataLicence.ALL_RIGHTS_RESERVED,
+        columns=[ROW_ID_COLUMN, a],
+        created=datetime(2018, 1, 3, 9),
+        row_count=RowCount(2, 2),
+        last_changed=datetime(2018, 1, 3, 9),
+    )
+    assert table.column_index == {ROW_ID_COLUMN: 0, a: 1}
+
+    page = Page(has_less=False, has_more=False, rows=[(1, "x"), (2, "y")])
+    assert page.row_ids() == {1, 2}
+    assert [row[table.column_index[a]] for row in page.rows] == ["x", "y"]